@@ -1,5 +1,9 @@
+import array
+import os
+import selectors
 import socket
-from typing import Tuple, Dict, Union
+import time
+from typing import Any, List, Optional, Tuple, Dict, Union
 
 from piservod.errors import (
     PiServoDError,
@@ -12,6 +16,210 @@ from piservod.errors import (
 )
 
 
+# Numeric error codes used by "ERROR <code> <message>" responses. Built
+# once so the error path is a dict lookup instead of substring scans.
+_ERROR_MAP = {
+    1: InvalidChannelError,
+    2: InvalidGPIOError,
+    3: ChannelNotConfiguredError,
+    4: PulseOutOfRangeError,
+    5: InvalidRangeError,
+}
+
+# Pre-encoded command templates. Formatting with bytes %-interpolation
+# skips the f-string + encode round-trip through str on every call.
+_CMD_SETUP = b"SETUP %d GPIO %d\n"
+_CMD_ENABLE = b"ENABLE %d\n"
+_CMD_DISABLE = b"DISABLE %d\n"
+_CMD_SET_RANGE = b"SET %d RANGE %d %d\n"
+_CMD_SET_PULSE = b"SET %d PULSE %d\n"
+_CMD_GET_RANGE = b"GET %d RANGE\n"
+_CMD_GET_PULSE = b"GET %d PULSE\n"
+_CMD_GET_STATE = b"GET %d STATE\n"
+
+# Largest iovec a single sendmsg() call may carry; bigger batches are
+# written in slices of this size
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+# The daemon serves channels 0-7, so per-channel commands are built once
+# at import; command generation becomes an index into these tuples.
+_ENABLE_CMDS = tuple(_CMD_ENABLE % channel for channel in range(8))
+_DISABLE_CMDS = tuple(_CMD_DISABLE % channel for channel in range(8))
+_SET_PULSE_PREFIX = tuple(b"SET %d PULSE " % channel for channel in range(8))
+
+# SETUP commands are memoized lazily - the valid (channel 0-7, gpio
+# 0-27) key space is tiny and hot-reload/test cycles repeat the same
+# pairs. Out-of-range values are never cached, so probing bad arguments
+# cannot grow the dict.
+_SETUP_CMDS: Dict[Tuple[int, int], bytes] = {}
+
+
+def _parse_state(response: bytes) -> Dict[str, Union[int, bool]]:
+    """
+    Parse a "GPIO <pin> ENABLE <0|1>" state response.
+
+    Fixed token positions allow byte slicing instead of a split(), which
+    would allocate a list on every poll.
+
+    Args:
+        response: Raw state response from the daemon
+
+    Returns:
+        Dictionary with keys: 'gpio', 'enabled'
+    """
+    space = response.find(b" ", 5)
+    return {
+        'gpio': int(response[5:space]),
+        'enabled': response[-1] == 0x31,
+    }
+
+
+def _raise_daemon_error(error_response: bytes) -> None:
+    """
+    Parse an error response and raise the matching exception.
+
+    Args:
+        error_response: Raw "ERROR ..." response from the daemon
+
+    Raises:
+        InvalidChannelError: If channel number is invalid
+        InvalidGPIOError: If GPIO pin is invalid
+        ChannelNotConfiguredError: If channel not configured
+        PulseOutOfRangeError: If pulse value out of range
+        InvalidRangeError: If range validation fails
+        PiServoDError: For any other error
+    """
+    tail = error_response[6:]  # Remove "ERROR " prefix
+
+    # Newer daemons send "ERROR <code> <message>" - dispatch on the
+    # numeric code without scanning the message text
+    parts = tail.split(None, 1)
+    if parts and parts[0].isdigit():
+        message = parts[1].strip().decode() if len(parts) > 1 else ""
+        raise _ERROR_MAP.get(int(parts[0]), PiServoDError)(message)
+
+    # Legacy daemons send a bare message - classify by substring
+    error_msg = tail.strip().decode()
+
+    if "Invalid channel" in error_msg:
+        raise InvalidChannelError(error_msg)
+    elif "Invalid GPIO" in error_msg:
+        raise InvalidGPIOError(error_msg)
+    elif "not configured" in error_msg:
+        raise ChannelNotConfiguredError(error_msg)
+    elif "out of range" in error_msg:
+        raise PulseOutOfRangeError(error_msg)
+    elif "min must be less than max" in error_msg:
+        raise InvalidRangeError(error_msg)
+    else:
+        raise PiServoDError(error_msg)
+
+
+class _Pipeline:
+    """
+    Buffers commands issued on a PiServoD connection and sends them in a
+    single write, reading all responses back in one pass.
+
+    Inside the pipeline block, commands are queued instead of sent, so a
+    batch of N commands costs one round-trip instead of N. Responses are
+    matched to commands by order and are available via the `responses`
+    attribute after the block exits (or after an explicit flush()).
+
+    Only commands that return a success flag (setup, enable, disable,
+    set_range, set_pulse) should be issued inside a pipeline - their return
+    value is meaningless until the pipeline is flushed.
+
+    Example:
+        with daemon.pipeline() as pipe:
+            daemon.set_pulse(0, 1500)
+            daemon.set_pulse(1, 1800)
+        # pipe.responses now holds both responses in order
+    """
+
+    def __init__(self, daemon: "PiServoD"):
+        self._daemon = daemon
+        self._commands: List[bytes] = []
+        self.responses: List[bytes] = []
+
+    def queue(self, payload: bytes) -> int:
+        """
+        Add an encoded command to the pipeline buffer.
+
+        Args:
+            payload: Newline-terminated command bytes to queue
+
+        Returns:
+            Index of the command within the batch
+        """
+        self._commands.append(payload)
+        return len(self._commands) - 1
+
+    def flush(self) -> List[bytes]:
+        """
+        Send all buffered commands in a single write and read all responses.
+
+        Returns:
+            List of raw responses, in command order
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            PiServoDError: If communication fails or any response is an
+                error (the exception matching the first error response is
+                raised)
+        """
+        if not self._commands:
+            return []
+
+        daemon = self._daemon
+        if daemon._socket is None:
+            raise NotConnectedError("Not connected to daemon. Call connect() first.")
+
+        try:
+            lines = daemon._transact_batch(self._commands)
+
+        except socket.timeout:
+            raise PiServoDError("Command timeout - daemon not responding")
+
+        except OSError as e:
+            raise PiServoDError(f"Communication error: {e}") from e
+
+        self._commands = []
+        self.responses = lines
+
+        for response in self.responses:
+            if response.startswith(b"ERROR"):
+                daemon._raise_error(response)
+
+        return self.responses
+
+    def __enter__(self) -> "_Pipeline":
+        """
+        Context manager entry - start buffering commands on the daemon.
+
+        Returns:
+            Self for use in with statement
+
+        Raises:
+            PiServoDError: If another pipeline is already active on this
+                connection - nesting would silently detach the outer one
+                and replay its commands out of order
+        """
+        if self._daemon._pipeline is not None:
+            raise PiServoDError("A pipeline is already active on this connection")
+
+        self._daemon._pipeline = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - stop buffering and flush on clean exit"""
+        self._daemon._pipeline = None
+        if exc_type is None:
+            self.flush()
+
+
 class PiServoD:
     """
     Client for communicating with the piservod daemon.
@@ -19,14 +227,57 @@ class PiServoD:
     Args:
         socket_path: Path to the Unix domain socket (default: /tmp/piservod.sock)
         timeout: Socket timeout in seconds (default: 1.0)
+        cache_ttl: How long (in seconds) state-query responses may be
+            served from a local cache. 0 disables caching (default).
+            A few milliseconds is enough to halve the syscall count in
+            loops that poll state before every update; mutating calls
+            invalidate the affected channel immediately.
     """
 
+    __slots__ = (
+        'socket_path', 'timeout', '_socket', '_sel', '_pipeline',
+        '_cache_ttl', '_cache', '_rbuf', '_rview', '_rpos', '_rlen',
+    )
+
     BUFFER_SIZE = 1024
 
-    def __init__(self, socket_path: str = '/tmp/piservod.sock', timeout: float = 1.0):
+    DEFAULT_SOCKET_PATH = '/tmp/piservod.sock'
+
+    # Side-car socket that hands out already-connected daemon FDs via
+    # SCM_RIGHTS. Short-lived processes (shell one-liners, CGI-style
+    # scripts) can adopt an open connection instead of dialing the daemon
+    # themselves; if no side-car is listening, connect() dials directly.
+    # Only consulted for the default socket_path - the side-car serves
+    # the default daemon, so a custom path must never adopt its FDs.
+    POOL_SOCKET_PATH = '/tmp/piservod.pool.sock'
+
+    # Socket buffer size requested on connect. Commands and responses are
+    # tiny, so small kernel buffers keep latency variance down compared to
+    # the much larger defaults.
+    SOCKET_BUFFER_SIZE = 8192
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        timeout: float = 1.0,
+        cache_ttl: float = 0.0,
+    ):
         self.socket_path = socket_path
         self.timeout = timeout
         self._socket = None
+        self._sel = None
+        self._pipeline = None
+
+        # Optional query cache, keyed by (channel, query); values are
+        # (monotonic timestamp, result)
+        self._cache_ttl = cache_ttl
+        self._cache = {}
+
+        # Persistent receive buffer for line-framed responses
+        self._rbuf = bytearray(self.BUFFER_SIZE)
+        self._rview = memoryview(self._rbuf)
+        self._rpos = 0
+        self._rlen = 0
 
     def connect(self) -> None:
         """
@@ -38,19 +289,95 @@ class PiServoD:
         if self._socket is not None:
             return
 
+        sock = self._adopt_pooled_socket()
+
+        if sock is None:
+            try:
+                sock = socket.socket(
+                    socket.AF_UNIX,
+                    socket.SOCK_STREAM | getattr(socket, 'SOCK_CLOEXEC', 0),
+                )
+                sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE
+                )
+                sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE
+                )
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+
+            except FileNotFoundError:
+                raise PiServoDError(
+                    f"Cannot connect to piservod at {self.socket_path}. "
+                    "Is the daemon running? (sudo piservod)"
+                )
+
+            except Exception as e:
+                raise PiServoDError(f"Connection failed: {e}")
+
+        self._socket = sock
+        self._rpos = 0
+        self._rlen = 0
+        self._cache.clear()
+
+        # Registered once so batched reads can wait for readiness
+        # without re-arming a poll per call
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self._socket, selectors.EVENT_READ)
+
+    def _adopt_pooled_socket(self) -> Optional[socket.socket]:
+        """
+        Try to adopt an already-connected daemon socket from a pool
+        side-car.
+
+        Connects to POOL_SOCKET_PATH and receives an open daemon FD via
+        an SCM_RIGHTS control message, skipping the daemon handshake
+        entirely.
+
+        Returns:
+            Adopted socket, or None if no side-car is listening (the
+            normal case) or a non-default socket_path is configured
+        """
+        if self.socket_path != self.DEFAULT_SOCKET_PATH:
+            return None
+
+        if not hasattr(socket.socket, 'recvmsg'):
+            return None
+
+        fds = array.array('i')
+
         try:
-            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self._socket.settimeout(self.timeout)
-            self._socket.connect(self.socket_path)
-
-        except FileNotFoundError:
-            raise PiServoDError(
-                f"Cannot connect to piservod at {self.socket_path}. "
-                "Is the daemon running? (sudo piservod)"
+            pool = socket.socket(
+                socket.AF_UNIX,
+                socket.SOCK_STREAM | getattr(socket, 'SOCK_CLOEXEC', 0),
             )
 
-        except Exception as e:
-            raise PiServoDError(f"Connection failed: {e}")
+            try:
+                pool.settimeout(self.timeout)
+                pool.connect(self.POOL_SOCKET_PATH)
+                _, ancdata, _, _ = pool.recvmsg(
+                    1,
+                    socket.CMSG_SPACE(fds.itemsize),
+                    getattr(socket, 'MSG_CMSG_CLOEXEC', 0),
+                )
+
+            finally:
+                pool.close()
+
+        except OSError:
+            return None
+
+        for cmsg_level, cmsg_type, cmsg_data in ancdata:
+            if cmsg_level == socket.SOL_SOCKET and cmsg_type == socket.SCM_RIGHTS:
+                fds.frombytes(cmsg_data[:fds.itemsize])
+
+        if not fds:
+            return None
+
+        sock = socket.fromfd(fds[0], socket.AF_UNIX, socket.SOCK_STREAM)
+        os.close(fds[0])
+        sock.settimeout(self.timeout)
+        return sock
 
     def is_connected(self) -> bool:
         """
@@ -63,10 +390,32 @@ class PiServoD:
 
     def disconnect(self) -> None:
         """Close connection to the daemon"""
+        if self._sel:
+            self._sel.close()
+            self._sel = None
+
         if self._socket:
             self._socket.close()
             self._socket = None
 
+    def pipeline(self) -> _Pipeline:
+        """
+        Create a pipeline that batches commands into a single round-trip.
+
+        Commands issued while the pipeline is active are buffered and sent
+        together in one write when the block exits, cutting the per-command
+        socket round-trip down to one for the whole batch.
+
+        Returns:
+            Pipeline context manager
+
+        Example:
+            with daemon.pipeline():
+                daemon.set_pulse(0, 1500)
+                daemon.set_pulse(1, 1800)
+        """
+        return _Pipeline(self)
+
     def setup(self, channel: int, gpio: int) -> bool:
         """
         Setup a servo channel on a specific GPIO pin.
@@ -84,8 +433,20 @@ class PiServoD:
             InvalidGPIOError: If GPIO pin number is invalid
             PiServoDError: If communication with daemon fails
         """
-        response = self._send_command(f"SETUP {channel} GPIO {gpio}")
-        return response == "OK"
+        self._cache.pop((channel, 'state'), None)
+        self._cache.pop((channel, 'range'), None)
+        self._cache.pop((channel, 'pulse'), None)
+
+        if 0 <= channel < 8 and 0 <= gpio <= 27:
+            cmd = _SETUP_CMDS.get((channel, gpio))
+            if cmd is None:
+                cmd = _SETUP_CMDS[(channel, gpio)] = _CMD_SETUP % (channel, gpio)
+        else:
+            # Invalid values get rejected by the daemon - don't cache them
+            cmd = _CMD_SETUP % (channel, gpio)
+
+        response = self._send_bytes(cmd)
+        return response == b"OK"
 
     def enable(self, channel: int) -> bool:
         """
@@ -103,8 +464,14 @@ class PiServoD:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
-        response = self._send_command(f"ENABLE {channel}")
-        return response == "OK"
+        self._cache.pop((channel, 'state'), None)
+
+        if 0 <= channel < len(_ENABLE_CMDS):
+            response = self._send_bytes(_ENABLE_CMDS[channel])
+        else:
+            response = self._send_bytes(_CMD_ENABLE % channel)
+
+        return response == b"OK"
 
     def disable(self, channel: int) -> bool:
         """
@@ -122,8 +489,14 @@ class PiServoD:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
-        response = self._send_command(f"DISABLE {channel}")
-        return response == "OK"
+        self._cache.pop((channel, 'state'), None)
+
+        if 0 <= channel < len(_DISABLE_CMDS):
+            response = self._send_bytes(_DISABLE_CMDS[channel])
+        else:
+            response = self._send_bytes(_CMD_DISABLE % channel)
+
+        return response == b"OK"
 
     def set_range(self, channel: int, min_pulse: int, max_pulse: int) -> bool:
         """
@@ -144,8 +517,14 @@ class PiServoD:
             InvalidRangeError: If min_pulse >= max_pulse
             PiServoDError: If communication with daemon fails
         """
-        response = self._send_command(f"SET {channel} RANGE {min_pulse} {max_pulse}")
-        return response == "OK"
+        self._cache.pop((channel, 'range'), None)
+        self._cache.pop((channel, 'pulse'), None)
+        response = self._send_bytes(_CMD_SET_RANGE % (channel, min_pulse, max_pulse))
+        if response == b"OK":
+            self._cache_put(channel, 'range', (min_pulse, max_pulse))
+            return True
+
+        return False
 
     def set_pulse(self, channel: int, pulse: int) -> bool:
         """
@@ -165,8 +544,75 @@ class PiServoD:
             PulseOutOfRangeError: If pulse is outside the configured min/max range
             PiServoDError: If communication with daemon fails
         """
-        response = self._send_command(f"SET {channel} PULSE {pulse}")
-        return response == "OK"
+        self._cache.pop((channel, 'pulse'), None)
+
+        # Only the pulse needs formatting when the channel prefix is cached
+        if 0 <= channel < len(_SET_PULSE_PREFIX):
+            cmd = _SET_PULSE_PREFIX[channel] + b"%d\n" % pulse
+        else:
+            cmd = _CMD_SET_PULSE % (channel, pulse)
+
+        response = self._send_bytes(cmd)
+        if response == b"OK":
+            self._cache_put(channel, 'pulse', pulse)
+            return True
+
+        return False
+
+    def set_pulses(self, pulses: List[Tuple[int, int]]) -> List[bool]:
+        """
+        Set pulse widths for several channels in a single round-trip.
+
+        All commands are concatenated into one write and all responses are
+        read back in one pass, so the cost is two syscalls regardless of
+        how many channels are updated. The batch is not atomic: if one
+        channel fails, commands sent before it may already have been
+        applied.
+
+        Args:
+            pulses: List of (channel, pulse) tuples
+
+        Returns:
+            List of success flags, in input order
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If a channel number is out of range (0-7)
+            ChannelNotConfiguredError: If a channel has not been setup yet
+            PulseOutOfRangeError: If a pulse is outside the configured range
+            PiServoDError: If communication with daemon fails
+        """
+        items = list(pulses)
+        if not items:
+            return []
+
+        if self._socket is None:
+            raise NotConnectedError("Not connected to daemon. Call connect() first.")
+
+        for channel, _ in items:
+            self._cache.pop((channel, 'pulse'), None)
+
+        cmds = [_CMD_SET_PULSE % (channel, pulse) for channel, pulse in items]
+
+        try:
+            responses = self._transact_batch(cmds)
+
+        except socket.timeout:
+            raise PiServoDError("Command timeout - daemon not responding")
+
+        except OSError as e:
+            raise PiServoDError(f"Communication error: {e}") from e
+
+        for response in responses:
+            if response.startswith(b"ERROR"):
+                self._raise_error(response)
+
+        results = [response == b"OK" for response in responses]
+        for (channel, pulse), ok in zip(items, results):
+            if ok:
+                self._cache_put(channel, 'pulse', pulse)
+
+        return results
 
     def get_range(self, channel: int) -> Tuple[int, int]:
         """
@@ -184,10 +630,16 @@ class PiServoD:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
+        cached = self._cache_get(channel, 'range')
+        if cached is not None:
+            return cached
+
         # Response format: "RANGE 1000 2000"
-        response = self._send_command(f"GET {channel} RANGE")
-        parts = response.split()
-        return (int(parts[1]), int(parts[2]))
+        response = self._send_bytes(_CMD_GET_RANGE % channel)
+        space = response.find(b" ", 6)
+        result = (int(response[6:space]), int(response[space + 1:]))
+        self._cache_put(channel, 'range', result)
+        return result
 
     def get_pulse(self, channel: int) -> int:
         """
@@ -205,9 +657,15 @@ class PiServoD:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
+        cached = self._cache_get(channel, 'pulse')
+        if cached is not None:
+            return cached
+
         # Response format: "PULSE 1500"
-        response = self._send_command(f"GET {channel} PULSE")
-        return int(response.split()[1])
+        response = self._send_bytes(_CMD_GET_PULSE % channel)
+        result = int(response[6:])
+        self._cache_put(channel, 'pulse', result)
+        return result
 
     def get_state(self, channel: int) -> Dict[str, Union[int, bool]]:
         """
@@ -225,23 +683,142 @@ class PiServoD:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
+        cached = self._cache_get(channel, 'state')
+        if cached is not None:
+            return dict(cached)
+
         # Response format: "GPIO 17 ENABLE 1"
-        response = self._send_command(f"GET {channel} STATE")
-        parts = response.split()
-        return {
-            'gpio': int(parts[1]),
-            'enabled': bool(int(parts[3]))
-        }
+        response = self._send_bytes(_CMD_GET_STATE % channel)
+        result = _parse_state(response)
+        self._cache_put(channel, 'state', result)
+        return dict(result)
 
-    def _send_command(self, command: str) -> str:
+    def _cache_get(self, channel: int, query: str) -> Optional[Any]:
         """
-        Send a command to the daemon and return the response.
+        Look up a cached query result that is still within the TTL.
 
         Args:
-            command: Command string to send
+            channel: Channel number
+            query: Query kind ('state', 'range' or 'pulse')
 
         Returns:
-            Response string from daemon
+            Cached result, or None if caching is off or the entry expired
+        """
+        if self._cache_ttl <= 0.0:
+            return None
+
+        entry = self._cache.get((channel, query))
+        if entry is None or time.monotonic() - entry[0] >= self._cache_ttl:
+            return None
+
+        return entry[1]
+
+    def _cache_put(self, channel: int, query: str, result: Any) -> None:
+        """
+        Store a query result in the cache if caching is enabled.
+
+        Args:
+            channel: Channel number
+            query: Query kind ('state', 'range' or 'pulse')
+            result: Value to cache
+        """
+        if self._cache_ttl > 0.0:
+            self._cache[(channel, query)] = (time.monotonic(), result)
+
+    def _transact_batch(self, cmds: List[bytes]) -> List[bytes]:
+        """
+        Send a batch of encoded commands and read one response per command.
+
+        Commands are written as an iovec via sendmsg() - no intermediate
+        concatenated bytes object - in slices of at most _IOV_MAX buffers
+        per call. Responses the daemon has already produced are drained
+        while sending is still in progress: on a large batch both sides'
+        socket buffers fill up otherwise, the daemon blocks writing
+        replies, stops reading, and the connection deadlocks. Platforms
+        without sendmsg join each slice for a plain send.
+
+        Args:
+            cmds: Encoded commands to send
+
+        Returns:
+            List of raw responses, in command order
+        """
+        expected = len(cmds)
+        responses: List[bytes] = []
+        buffers = [memoryview(cmd) for cmd in cmds]
+        use_sendmsg = hasattr(socket.socket, 'sendmsg')
+
+        self._sel.modify(self._socket, selectors.EVENT_READ | selectors.EVENT_WRITE)
+
+        try:
+            while buffers:
+                ready = self._sel.select(self.timeout)
+                if not ready:
+                    raise socket.timeout("timed out")
+
+                mask = ready[0][1]
+
+                # Drain ready responses so the daemon never stalls on a
+                # full reply buffer mid-batch
+                if mask & selectors.EVENT_READ and len(responses) < expected:
+                    responses.append(self._readline())
+
+                if mask & selectors.EVENT_WRITE:
+                    if use_sendmsg:
+                        sent = self._socket.sendmsg(buffers[:_IOV_MAX])
+                    else:
+                        sent = self._socket.send(
+                            b"".join(bytes(b) for b in buffers[:_IOV_MAX])
+                        )
+
+                    # Drop fully-written buffers, trim a partial head
+                    while buffers and sent >= len(buffers[0]):
+                        sent -= len(buffers[0])
+                        buffers.pop(0)
+
+                    if sent:
+                        buffers[0] = buffers[0][sent:]
+
+        finally:
+            self._sel.modify(self._socket, selectors.EVENT_READ)
+
+        while len(responses) < expected:
+            responses.append(self._readline(wait=True))
+
+        return responses
+
+    def _send_command(self, command: str) -> bytes:
+        """
+        Send a command string to the daemon and return the response.
+
+        Thin wrapper around _send_bytes() for callers that build command
+        strings themselves.
+
+        Args:
+            command: Command string to send (without trailing newline)
+
+        Returns:
+            Raw response from daemon
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            PiServoDError: If communication fails or daemon returns an error
+        """
+        return self._send_bytes(f"{command}\n".encode())
+
+    def _send_bytes(self, payload: bytes) -> bytes:
+        """
+        Send an encoded command to the daemon and return the response.
+
+        If a pipeline is active, the command is queued instead and an empty
+        response is returned; the real response is read when the pipeline
+        is flushed.
+
+        Args:
+            payload: Newline-terminated command bytes to send
+
+        Returns:
+            Raw response from daemon
 
         Raises:
             NotConnectedError: If not connected to daemon
@@ -255,22 +832,95 @@ class PiServoD:
         if self._socket is None:
             raise NotConnectedError("Not connected to daemon. Call connect() first.")
 
-        try:
-            self._socket.sendall(f"{command}\n".encode())
-            response = self._socket.recv(self.BUFFER_SIZE).decode().strip()
-
-            if response.startswith("ERROR"):
-                self._raise_error(response)
+        if self._pipeline is not None:
+            self._pipeline.queue(payload)
+            return b""
 
-            return response
+        try:
+            self._socket.sendall(payload)
+            response = self._readline()
 
         except socket.timeout:
             raise PiServoDError("Command timeout - daemon not responding")
 
-        except Exception as e:
-            raise PiServoDError(f"Communication error: {e}")
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # The daemon may have restarted between calls - reconnect once
+            # and retry before giving up
+            self.disconnect()
+            self.connect()
+
+            try:
+                self._socket.sendall(payload)
+                response = self._readline()
+
+            except socket.timeout:
+                raise PiServoDError("Command timeout - daemon not responding")
+
+            except (BrokenPipeError, ConnectionResetError):
+                raise PiServoDError("Connection to daemon lost") from e
+
+        if response.startswith(b"ERROR"):
+            self._raise_error(response)
 
-    def _raise_error(self, error_response: str) -> None:
+        return response
+
+    def _readline(self, wait: bool = False) -> bytes:
+        """
+        Read one newline-terminated response from the daemon.
+
+        Unread data is kept in a persistent buffer, so pipelined responses
+        arriving in a single packet only cost one recv syscall, and short
+        reads (responses split across packets) are handled correctly.
+
+        Args:
+            wait: Wait for socket readiness via the persistent selector
+                before refilling the buffer. Used by batched reads to reap
+                responses as they become available; simple calls keep the
+                plain blocking recv.
+
+        Returns:
+            Response line as bytes, without the trailing newline
+
+        Raises:
+            PiServoDError: If the daemon closes the connection or the
+                readiness wait times out
+        """
+        while True:
+            newline = self._rbuf.find(b"\n", self._rpos, self._rlen)
+            if newline >= 0:
+                line = bytes(self._rbuf[self._rpos:newline])
+                self._rpos = newline + 1
+                if self._rpos == self._rlen:
+                    self._rpos = 0
+                    self._rlen = 0
+                return line
+
+            if self._rlen == len(self._rbuf):
+                if self._rpos > 0:
+                    # Compact in place: move unread bytes to the front so
+                    # the same allocation keeps being reused
+                    remaining = self._rlen - self._rpos
+                    self._rview[:remaining] = self._rview[self._rpos:self._rlen]
+                    self._rpos = 0
+                    self._rlen = remaining
+                else:
+                    # A single line exceeds the buffer - double its
+                    # capacity (the view must be released first, since a
+                    # bytearray with an exported buffer cannot resize)
+                    self._rview.release()
+                    self._rbuf.extend(bytes(len(self._rbuf)))
+                    self._rview = memoryview(self._rbuf)
+
+            if wait and not self._sel.select(self.timeout):
+                raise PiServoDError("Command timeout - daemon not responding")
+
+            received = self._socket.recv_into(self._rview[self._rlen:])
+            if received == 0:
+                raise PiServoDError("Connection closed by daemon")
+
+            self._rlen += received
+
+    def _raise_error(self, error_response: bytes) -> None:
         """
         Parse error response and raise appropriate exception.
 
@@ -285,20 +935,7 @@ class PiServoD:
             InvalidRangeError: If range validation fails
             PiServoDError: For any other error
         """
-        error_msg = error_response[6:].strip()  # Remove "ERROR " prefix
-
-        if "Invalid channel" in error_msg:
-            raise InvalidChannelError(error_msg)
-        elif "Invalid GPIO" in error_msg:
-            raise InvalidGPIOError(error_msg)
-        elif "not configured" in error_msg:
-            raise ChannelNotConfiguredError(error_msg)
-        elif "out of range" in error_msg:
-            raise PulseOutOfRangeError(error_msg)
-        elif "min must be less than max" in error_msg:
-            raise InvalidRangeError(error_msg)
-        else:
-            raise PiServoDError(error_msg)
+        _raise_daemon_error(error_response)
 
     def __enter__(self) -> "PiServoD":
         """
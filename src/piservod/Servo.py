@@ -1,7 +1,7 @@
-from typing import Optional, Tuple, Dict, Union
+from typing import Optional, List, Tuple, Dict, Union
 
 from piservod.PiServoD import PiServoD
-from piservod.errors import PiServoDError
+from piservod.errors import PiServoDError, PulseOutOfRangeError
 
 
 class Servo:
@@ -16,6 +16,8 @@ class Servo:
         gpio: GPIO pin number (optional, only needed if not already setup)
         min_pulse: Minimum pulse width in microseconds (default: 1000)
         max_pulse: Maximum pulse width in microseconds (default: 2000)
+        strict_local: Validate pulse widths against the configured range
+            locally before contacting the daemon (default: True)
 
     Example:
         Servo.connect()
@@ -32,6 +34,11 @@ class Servo:
         Servo.disconnect()
     """
 
+    # Fixed attribute set - subclasses adding attributes must declare
+    # their own __slots__. The shared daemon stays a class variable; the
+    # per-instance shadow lives in the _d slot.
+    __slots__ = ('channel', 'min_pulse', 'max_pulse', '_d', '_center', '_strict_local')
+
     # Class variables shared across all instances
     _daemon: Optional[PiServoD] = None
 
@@ -58,6 +65,65 @@ class Servo:
         if cls._daemon:
             cls._daemon.disconnect()
 
+    @classmethod
+    def pipeline(cls):
+        """
+        Create a pipeline that batches commands into a single round-trip.
+
+        Commands issued on any Servo while the pipeline is active are
+        buffered and sent together when the block exits.
+
+        Returns:
+            Pipeline context manager
+
+        Raises:
+            PiServoDError: If not connected to daemon
+
+        Example:
+            with Servo.pipeline():
+                servo1.set_pulse(1500)
+                servo2.set_pulse(1800)
+        """
+        if cls._daemon is None:
+            raise PiServoDError(
+                "Not connected to daemon. Call Servo.connect() before pipelining."
+            )
+
+        return cls._daemon.pipeline()
+
+    @classmethod
+    def set_pulses(cls, pulses: Dict["Servo", int]) -> List[bool]:
+        """
+        Set pulse widths for several servos in a single round-trip.
+
+        The batch is not atomic: if one servo fails, commands sent before
+        it may already have been applied.
+
+        Args:
+            pulses: Mapping of servo to pulse width in microseconds
+
+        Returns:
+            List of success flags, in input order
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If a channel number is out of range (0-7)
+            ChannelNotConfiguredError: If a channel has not been setup yet
+            PulseOutOfRangeError: If a pulse is outside the configured range
+            PiServoDError: If communication with daemon fails
+
+        Example:
+            Servo.set_pulses({servo1: 1500, servo2: 1800})
+        """
+        if cls._daemon is None:
+            raise PiServoDError(
+                "Not connected to daemon. Call Servo.connect() before creating servos."
+            )
+
+        return cls._daemon.set_pulses(
+            [(servo.channel, pulse) for servo, pulse in pulses.items()]
+        )
+
     @classmethod
     def is_connected(cls) -> bool:
         """
@@ -73,7 +139,8 @@ class Servo:
         channel: int,
         gpio: int,
         min_pulse: int = 1000,
-        max_pulse: int = 2000
+        max_pulse: int = 2000,
+        strict_local: bool = True
     ):
         """
         Create a servo instance.
@@ -83,18 +150,30 @@ class Servo:
             gpio: GPIO pin number
             min_pulse: Minimum pulse width in microseconds
             max_pulse: Maximum pulse width in microseconds
+            strict_local: Validate pulse widths against the configured
+                range locally, raising PulseOutOfRangeError without a
+                round-trip to the daemon. Disable to rely on daemon-side
+                validation only.
 
         Raises:
             PiServoDError: If not connected to daemon or setup fails
         """
-        if self._daemon is None or not self._daemon.is_connected():
+        # A bare None check is enough here - if the connection dropped, the
+        # setup RPC below fails loudly with NotConnectedError anyway
+        if type(self)._daemon is None:
             raise PiServoDError(
                 "Not connected to daemon. Call Servo.connect() before creating servos."
             )
 
+        # Hoist the shared daemon to an instance attribute so every method
+        # call skips the class-level lookup
+        self._d = type(self)._daemon
+
         self.channel = channel
         self.min_pulse = min_pulse
         self.max_pulse = max_pulse
+        self._center = (min_pulse + max_pulse) // 2
+        self._strict_local = strict_local
 
         self._setup(gpio)
         self.set_range(min_pulse, max_pulse)
@@ -112,7 +191,7 @@ class Servo:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
-        return self._daemon.enable(self.channel)
+        return self._d.enable(self.channel)
 
     def disable(self) -> bool:
         """
@@ -127,7 +206,7 @@ class Servo:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
-        return self._daemon.disable(self.channel)
+        return self._d.disable(self.channel)
 
     def set_range(self, min_pulse: int, max_pulse: int) -> bool:
         """
@@ -149,7 +228,8 @@ class Servo:
         """
         self.min_pulse = min_pulse
         self.max_pulse = max_pulse
-        return self._daemon.set_range(self.channel, min_pulse, max_pulse)
+        self._center = (min_pulse + max_pulse) // 2
+        return self._d.set_range(self.channel, min_pulse, max_pulse)
 
     def set_pulse(self, pulse: int) -> bool:
         """
@@ -168,7 +248,12 @@ class Servo:
             PulseOutOfRangeError: If pulse is outside the configured min/max range
             PiServoDError: If communication with daemon fails
         """
-        return self._daemon.set_pulse(self.channel, pulse)
+        if self._strict_local and (pulse < self.min_pulse or pulse > self.max_pulse):
+            raise PulseOutOfRangeError(
+                f"Pulse {pulse} out of range ({self.min_pulse}-{self.max_pulse})"
+            )
+
+        return self._d.set_pulse(self.channel, pulse)
 
     def get_range(self) -> Tuple[int, int]:
         """
@@ -183,7 +268,7 @@ class Servo:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
-        return self._daemon.get_range(self.channel)
+        return self._d.get_range(self.channel)
 
     def get_pulse(self) -> int:
         """
@@ -198,7 +283,7 @@ class Servo:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
-        return self._daemon.get_pulse(self.channel)
+        return self._d.get_pulse(self.channel)
 
     def get_state(self) -> Dict[str, Union[int, bool]]:
         """
@@ -213,7 +298,7 @@ class Servo:
             ChannelNotConfiguredError: If channel has not been setup yet
             PiServoDError: If communication with daemon fails
         """
-        return self._daemon.get_state(self.channel)
+        return self._d.get_state(self.channel)
 
     # Convenience methods - not part of the actual daemon
 
@@ -247,8 +332,7 @@ class Servo:
             PulseOutOfRangeError: If center pulse is outside configured range
             PiServoDError: If communication with daemon fails
         """
-        center_pulse = (self.min_pulse + self.max_pulse) // 2
-        return self.set_pulse(center_pulse)
+        return self._d.set_pulse(self.channel, self._center)
 
     def _setup(self, gpio: int) -> bool:
         """
@@ -266,7 +350,7 @@ class Servo:
             InvalidGPIOError: If GPIO pin number is invalid
             PiServoDError: If communication with daemon fails
         """
-        return self._daemon.setup(self.channel, gpio)
+        return self._d.setup(self.channel, gpio)
 
     def __enter__(self) -> "Servo":
         """
@@ -0,0 +1,486 @@
+import asyncio
+from typing import List, Optional, Tuple, Dict, Union
+
+from piservod.PiServoD import (
+    _CMD_SETUP,
+    _CMD_ENABLE,
+    _CMD_DISABLE,
+    _CMD_SET_RANGE,
+    _CMD_SET_PULSE,
+    _CMD_GET_RANGE,
+    _CMD_GET_PULSE,
+    _CMD_GET_STATE,
+    _parse_state,
+    _raise_daemon_error,
+)
+from piservod.errors import PiServoDError, NotConnectedError
+
+
+class _AsyncPipeline:
+    """
+    Buffers commands issued on an AsyncPiServoD connection and sends them
+    in a single write, reading all responses back in one pass.
+
+    Works like the synchronous pipeline: commands issued inside the block
+    are queued, the batch goes out as one writelines() call on exit and
+    responses are matched by order. Only commands that return a success
+    flag should be issued inside a pipeline.
+
+    Example:
+        async with daemon.pipeline() as pipe:
+            await daemon.set_pulse(0, 1500)
+            await daemon.set_pulse(1, 1800)
+        # pipe.responses now holds both responses in order
+    """
+
+    def __init__(self, daemon: "AsyncPiServoD"):
+        self._daemon = daemon
+        self._commands: List[bytes] = []
+        self.responses: List[bytes] = []
+
+    def queue(self, payload: bytes) -> int:
+        """
+        Add an encoded command to the pipeline buffer.
+
+        Args:
+            payload: Newline-terminated command bytes to queue
+
+        Returns:
+            Index of the command within the batch
+        """
+        self._commands.append(payload)
+        return len(self._commands) - 1
+
+    async def flush(self) -> List[bytes]:
+        """
+        Send all buffered commands in a single write and read all responses.
+
+        Returns:
+            List of raw responses, in command order
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            PiServoDError: If communication fails or any response is an
+                error (the exception matching the first error response is
+                raised)
+        """
+        if not self._commands:
+            return []
+
+        daemon = self._daemon
+        if daemon._writer is None:
+            raise NotConnectedError("Not connected to daemon. Call connect() first.")
+
+        expected = len(self._commands)
+
+        async with daemon._lock:
+            # writelines() hands the buffer list to the transport in one go
+            daemon._writer.writelines(self._commands)
+            await daemon._writer.drain()
+
+            self._commands = []
+            self.responses = [await daemon._readline() for _ in range(expected)]
+
+        for response in self.responses:
+            if response.startswith(b"ERROR"):
+                _raise_daemon_error(response)
+
+        return self.responses
+
+    async def __aenter__(self) -> "_AsyncPipeline":
+        """
+        Context manager entry - start buffering commands on the daemon.
+
+        Returns:
+            Self for use in async with statement
+
+        Raises:
+            PiServoDError: If another pipeline is already active on this
+                connection - nesting would silently detach the outer one
+                and replay its commands out of order
+        """
+        if self._daemon._pipeline is not None:
+            raise PiServoDError("A pipeline is already active on this connection")
+
+        self._daemon._pipeline = self
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - stop buffering and flush on clean exit"""
+        self._daemon._pipeline = None
+        if exc_type is None:
+            await self.flush()
+
+
+class AsyncPiServoD:
+    """
+    Asyncio client for communicating with the piservod daemon.
+
+    Mirrors the PiServoD API with coroutine methods, so many servos can
+    be driven concurrently from one event loop:
+
+        daemon = AsyncPiServoD()
+        await daemon.connect()
+        await asyncio.gather(
+            daemon.set_pulse(0, 1500),
+            daemon.set_pulse(1, 1800),
+        )
+
+    Commands on the shared connection are serialized internally; use
+    pipeline() or set_pulses() to batch several commands into a single
+    round-trip.
+
+    Args:
+        socket_path: Path to the Unix domain socket (default: /tmp/piservod.sock)
+        timeout: Per-command timeout in seconds (default: 1.0)
+    """
+
+    __slots__ = (
+        'socket_path', 'timeout', '_reader', '_writer', '_pipeline', '_lock',
+    )
+
+    def __init__(self, socket_path: str = '/tmp/piservod.sock', timeout: float = 1.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pipeline: Optional[_AsyncPipeline] = None
+
+        # Created in connect() so the lock binds to the running loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def connect(self) -> None:
+        """
+        Establish connection to the daemon.
+
+        Raises:
+            PiServoDError: If the daemon is not running or connection fails
+        """
+        if self._writer is not None:
+            return
+
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self.socket_path
+            )
+            self._lock = asyncio.Lock()
+
+        except FileNotFoundError:
+            raise PiServoDError(
+                f"Cannot connect to piservod at {self.socket_path}. "
+                "Is the daemon running? (sudo piservod)"
+            )
+
+        except OSError as e:
+            raise PiServoDError(f"Connection failed: {e}") from e
+
+    def is_connected(self) -> bool:
+        """
+        Check if currently connected to the daemon.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self._writer is not None
+
+    async def disconnect(self) -> None:
+        """Close connection to the daemon"""
+        if self._writer:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+            self._reader = None
+
+    def pipeline(self) -> _AsyncPipeline:
+        """
+        Create a pipeline that batches commands into a single round-trip.
+
+        Returns:
+            Async pipeline context manager
+
+        Example:
+            async with daemon.pipeline():
+                await daemon.set_pulse(0, 1500)
+                await daemon.set_pulse(1, 1800)
+        """
+        return _AsyncPipeline(self)
+
+    async def setup(self, channel: int, gpio: int) -> bool:
+        """
+        Setup a servo channel on a specific GPIO pin.
+
+        Args:
+            channel: Channel number (0-7)
+            gpio: GPIO pin number (0-27)
+
+        Returns:
+            True on success
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            InvalidGPIOError: If GPIO pin number is invalid
+            PiServoDError: If communication with daemon fails
+        """
+        response = await self._send_bytes(_CMD_SETUP % (channel, gpio))
+        return response == b"OK"
+
+    async def enable(self, channel: int) -> bool:
+        """
+        Enable PWM output on a channel.
+
+        Args:
+            channel: Channel number (0-7)
+
+        Returns:
+            True on success
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            ChannelNotConfiguredError: If channel has not been setup yet
+            PiServoDError: If communication with daemon fails
+        """
+        response = await self._send_bytes(_CMD_ENABLE % channel)
+        return response == b"OK"
+
+    async def disable(self, channel: int) -> bool:
+        """
+        Disable PWM output on a channel.
+
+        Args:
+            channel: Channel number (0-7)
+
+        Returns:
+            True on success
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            ChannelNotConfiguredError: If channel has not been setup yet
+            PiServoDError: If communication with daemon fails
+        """
+        response = await self._send_bytes(_CMD_DISABLE % channel)
+        return response == b"OK"
+
+    async def set_range(self, channel: int, min_pulse: int, max_pulse: int) -> bool:
+        """
+        Set the pulse width range for a channel.
+
+        Args:
+            channel: Channel number (0-7)
+            min_pulse: Minimum pulse width in microseconds
+            max_pulse: Maximum pulse width in microseconds
+
+        Returns:
+            True on success
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            ChannelNotConfiguredError: If channel has not been setup yet
+            InvalidRangeError: If min_pulse >= max_pulse
+            PiServoDError: If communication with daemon fails
+        """
+        response = await self._send_bytes(_CMD_SET_RANGE % (channel, min_pulse, max_pulse))
+        return response == b"OK"
+
+    async def set_pulse(self, channel: int, pulse: int) -> bool:
+        """
+        Set the pulse width for a channel.
+
+        Args:
+            channel: Channel number (0-7)
+            pulse: Pulse width in microseconds
+
+        Returns:
+            True on success
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            ChannelNotConfiguredError: If channel has not been setup yet
+            PulseOutOfRangeError: If pulse is outside the configured min/max range
+            PiServoDError: If communication with daemon fails
+        """
+        response = await self._send_bytes(_CMD_SET_PULSE % (channel, pulse))
+        return response == b"OK"
+
+    async def set_pulses(self, pulses: List[Tuple[int, int]]) -> List[bool]:
+        """
+        Set pulse widths for several channels in a single round-trip.
+
+        The batch is not atomic: if one channel fails, commands sent
+        before it may already have been applied.
+
+        Args:
+            pulses: List of (channel, pulse) tuples
+
+        Returns:
+            List of success flags, in input order
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If a channel number is out of range (0-7)
+            ChannelNotConfiguredError: If a channel has not been setup yet
+            PulseOutOfRangeError: If a pulse is outside the configured range
+            PiServoDError: If communication with daemon fails
+        """
+        items = list(pulses)
+        if not items:
+            return []
+
+        if self._writer is None:
+            raise NotConnectedError("Not connected to daemon. Call connect() first.")
+
+        cmds = [_CMD_SET_PULSE % (channel, pulse) for channel, pulse in items]
+
+        async with self._lock:
+            self._writer.writelines(cmds)
+            await self._writer.drain()
+            responses = [await self._readline() for _ in range(len(items))]
+
+        for response in responses:
+            if response.startswith(b"ERROR"):
+                _raise_daemon_error(response)
+
+        return [response == b"OK" for response in responses]
+
+    async def get_range(self, channel: int) -> Tuple[int, int]:
+        """
+        Get the pulse width range for a channel.
+
+        Args:
+            channel: Channel number (0-7)
+
+        Returns:
+            Tuple of (min_pulse, max_pulse) in microseconds
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            ChannelNotConfiguredError: If channel has not been setup yet
+            PiServoDError: If communication with daemon fails
+        """
+        # Response format: "RANGE 1000 2000"
+        response = await self._send_bytes(_CMD_GET_RANGE % channel)
+        space = response.find(b" ", 6)
+        return (int(response[6:space]), int(response[space + 1:]))
+
+    async def get_pulse(self, channel: int) -> int:
+        """
+        Get the current pulse width for a channel.
+
+        Args:
+            channel: Channel number (0-7)
+
+        Returns:
+            Current pulse width in microseconds
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            ChannelNotConfiguredError: If channel has not been setup yet
+            PiServoDError: If communication with daemon fails
+        """
+        # Response format: "PULSE 1500"
+        response = await self._send_bytes(_CMD_GET_PULSE % channel)
+        return int(response[6:])
+
+    async def get_state(self, channel: int) -> Dict[str, Union[int, bool]]:
+        """
+        Get the current state of a channel.
+
+        Args:
+            channel: Channel number (0-7)
+
+        Returns:
+            Dictionary with keys: 'gpio', 'enabled'
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            InvalidChannelError: If channel number is out of range (0-7)
+            ChannelNotConfiguredError: If channel has not been setup yet
+            PiServoDError: If communication with daemon fails
+        """
+        # Response format: "GPIO 17 ENABLE 1"
+        response = await self._send_bytes(_CMD_GET_STATE % channel)
+        return _parse_state(response)
+
+    async def _send_bytes(self, payload: bytes) -> bytes:
+        """
+        Send an encoded command to the daemon and return the response.
+
+        If a pipeline is active, the command is queued instead and an
+        empty response is returned; the real response is read when the
+        pipeline is flushed. Otherwise the write/read transaction is
+        serialized on an internal lock so concurrent callers cannot
+        mismatch responses.
+
+        Args:
+            payload: Newline-terminated command bytes to send
+
+        Returns:
+            Raw response from daemon
+
+        Raises:
+            NotConnectedError: If not connected to daemon
+            PiServoDError: If communication fails or daemon returns an error
+        """
+        if self._writer is None:
+            raise NotConnectedError("Not connected to daemon. Call connect() first.")
+
+        if self._pipeline is not None:
+            self._pipeline.queue(payload)
+            return b""
+
+        async with self._lock:
+            self._writer.write(payload)
+            await self._writer.drain()
+            response = await self._readline()
+
+        if response.startswith(b"ERROR"):
+            _raise_daemon_error(response)
+
+        return response
+
+    async def _readline(self) -> bytes:
+        """
+        Read one newline-terminated response from the daemon.
+
+        Returns:
+            Response line as bytes, without the trailing newline
+
+        Raises:
+            PiServoDError: If the daemon closes the connection or the
+                command times out
+        """
+        try:
+            line = await asyncio.wait_for(
+                self._reader.readuntil(b"\n"), self.timeout
+            )
+
+        except asyncio.TimeoutError:
+            raise PiServoDError("Command timeout - daemon not responding")
+
+        except asyncio.IncompleteReadError:
+            raise PiServoDError("Connection closed by daemon")
+
+        return line[:-1]
+
+    async def __aenter__(self) -> "AsyncPiServoD":
+        """
+        Context manager entry - establish connection.
+
+        Returns:
+            Self for use in async with statement
+
+        Raises:
+            PiServoDError: If connection fails
+        """
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - close connection"""
+        await self.disconnect()